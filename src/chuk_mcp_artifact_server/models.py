@@ -7,7 +7,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # --------------------------------------------------------------------------- #
@@ -27,10 +27,19 @@ class ArtifactTools(str, Enum):
     WRITE_FILE = "write_file"
 
 
+# --------------------------------------------------------------------------- #
+#  Common base
+# --------------------------------------------------------------------------- #
+class _Model(BaseModel):
+    """Base for all artifact models: immutable once built."""
+
+    model_config = ConfigDict(frozen=True)
+
+
 # --------------------------------------------------------------------------- #
 #  Shared sub-models
 # --------------------------------------------------------------------------- #
-class ArtifactInfo(BaseModel):
+class ArtifactInfo(_Model):
     """Compact information about a stored artefact."""
 
     artifact_id: str = Field(..., description="Unique identifier of the artefact")
@@ -46,7 +55,7 @@ class ArtifactInfo(BaseModel):
 # --------------------------------------------------------------------------- #
 #  Input models - UPDATED WITH SESSION REQUIREMENTS
 # --------------------------------------------------------------------------- #
-class ListSessionFilesInput(BaseModel):
+class ListSessionFilesInput(_Model):
     session_id: Optional[str] = Field(None, description="Session id to list files from (optional if context available)")
     prefix: Optional[str] = Field(
         None,
@@ -54,7 +63,7 @@ class ListSessionFilesInput(BaseModel):
     )
 
 
-class UploadFileInput(BaseModel):
+class UploadFileInput(_Model):
     data_base64: str = Field(..., description="Base64-encoded file bytes")
     filename: str = Field(..., description="Filename, inc. extension")
     mime: str = Field(..., description="MIME type")
@@ -63,7 +72,7 @@ class UploadFileInput(BaseModel):
     meta: Dict[str, Any] = Field(default_factory=dict, description="User metadata")
 
 
-class DownloadFileInput(BaseModel):
+class DownloadFileInput(_Model):
     artifact_id: str = Field(..., description="Id of artefact to download")
     presign: bool = Field(
         True,
@@ -71,20 +80,20 @@ class DownloadFileInput(BaseModel):
     )
 
 
-class GetMetadataInput(BaseModel):
+class GetMetadataInput(_Model):
     artifact_id: str = Field(..., description="Id of artefact")
 
 
-class UpdateMetadataInput(BaseModel):
+class UpdateMetadataInput(_Model):
     artifact_id: str = Field(..., description="Id of artefact")
     meta: Dict[str, Any] = Field(..., description="Metadata to merge / overwrite")
 
 
-class DeleteFileInput(BaseModel):
+class DeleteFileInput(_Model):
     artifact_id: str = Field(..., description="Id of artefact to delete")
 
 
-class CopyFileInput(BaseModel):
+class CopyFileInput(_Model):
     artifact_id: str = Field(..., description="Source artefact id")
     filename: Optional[str] = Field(None, description="Optional new filename")
     session_id: Optional[str] = Field(
@@ -94,24 +103,24 @@ class CopyFileInput(BaseModel):
     meta: Dict[str, Any] = Field(default_factory=dict, description="Extra metadata")
 
 
-class ListDirectoryInput(BaseModel):
+class ListDirectoryInput(_Model):
     directory: str = Field(..., description="Pseudo directory prefix to list")
     session_id: Optional[str] = Field(None, description="Session id to list within (optional if context available)")
 
 
-class MoveFileInput(BaseModel):
+class MoveFileInput(_Model):
     artifact_id: str = Field(..., description="Id of artefact to move/rename")
     new_filename: Optional[str] = Field(None, description="New filename")
     new_meta: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
 
-class ReadFileInput(BaseModel):
+class ReadFileInput(_Model):
     artifact_id: str = Field(..., description="Id of artefact to read")
     as_text: bool = Field(True, description="Return as text (True) or binary (False)")
     encoding: str = Field("utf-8", description="Text encoding for text mode")
 
 
-class WriteFileInput(BaseModel):
+class WriteFileInput(_Model):
     content: str = Field(..., description="File content to write")
     filename: str = Field(..., description="Filename for the new file")
     session_id: Optional[str] = Field(None, description="Session id for grouping (optional if context available)")
@@ -127,7 +136,7 @@ class WriteFileInput(BaseModel):
 # --------------------------------------------------------------------------- #
 #  Output models
 # --------------------------------------------------------------------------- #
-class ListSessionFilesResult(BaseModel):
+class ListSessionFilesResult(_Model):
     count: int = Field(..., description="Number of artefacts returned")
     session_id: str = Field(..., description="Session ID that was used")
     artifacts: List[ArtifactInfo] = Field([], description="List of artefact infos")
@@ -139,7 +148,7 @@ class UploadFileResult(ArtifactInfo):
     operation: str = Field("create", description="Type of operation performed")
 
 
-class DownloadFileResult(BaseModel):
+class DownloadFileResult(_Model):
     artifact: ArtifactInfo = Field(..., description="Artefact info")
     download_url: Optional[str] = Field(None, description="Presigned URL if used")
     data_base64: Optional[str] = Field(
@@ -151,7 +160,7 @@ class UpdateMetadataResult(ArtifactInfo):
     """Alias - returns updated info."""
 
 
-class DeleteFileResult(BaseModel):
+class DeleteFileResult(_Model):
     success: bool = Field(..., description="True if artefact deleted")
     artifact_id: str = Field(..., description="ID of the deleted artifact")
 
@@ -161,7 +170,7 @@ class CopyFileResult(ArtifactInfo):
     operation: str = Field("copy", description="Type of operation performed")
 
 
-class ListDirectoryResult(BaseModel):
+class ListDirectoryResult(_Model):
     """Directory listing result."""
     count: int = Field(..., description="Number of artefacts returned")
     session_id: str = Field(..., description="Session ID that was used")
@@ -174,16 +183,19 @@ class MoveFileResult(ArtifactInfo):
     operation: str = Field("move", description="Type of operation performed")
 
 
-class ReadFileResult(BaseModel):
+class ReadFileResult(_Model):
     artifact_id: str = Field(..., description="Id of artefact that was read")
     content_type: str = Field(..., description="Content type: 'text' or 'binary'")
     content: Optional[str] = Field(None, description="Text content if as_text=True")
     content_base64: Optional[str] = Field(None, description="Base64 binary content if as_text=False")
     encoding: Optional[str] = Field(None, description="Text encoding used")
     bytes: Optional[int] = Field(None, description="Size in bytes for binary content")
+    download_url: Optional[str] = Field(
+        None, description="Presigned URL used instead of content_base64 for large binaries"
+    )
 
 
 class WriteFileResult(ArtifactInfo):
     """Write file result with additional fields."""
     download_url: Optional[str] = Field(None, description="Short presigned URL")
-    operation: str = Field("create", description="Type of operation performed (create/overwrite)")
\ No newline at end of file
+    operation: str = Field("create", description="Type of operation performed (create/overwrite)")
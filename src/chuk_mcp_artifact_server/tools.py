@@ -6,8 +6,9 @@ Key enhancements
 • Startup diagnostics at DEBUG level
 • Robust _info() that derives artefact_id from S3 keys and injects
   fallback session_id values when the backend omits them
-• Every tool now passes a fallback_session_id to _info(), ensuring
-  responses never show `"session_id": null`
+• Tools with authoritative session context (listing, upload, write) pass
+  a fallback_session_id to _info(), ensuring their responses never show
+  `"session_id": null`
 • Safe-overwrite fallback: if S3 blocks an overwrite because the original
   object’s session_id is None, we delete then re-write inside the caller’s
   session
@@ -15,10 +16,20 @@ Key enhancements
 
 from __future__ import annotations
 
-import base64
+import asyncio
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Dict, List, Optional, TypeVar
+
+try:  # SIMD-accelerated codec (pip install .[fast]; not in the dev group)
+    from pybase64 import b64decode as _b64decode, b64encode as _b64encode  # pragma: no cover
+except ImportError:
+    from base64 import b64encode as _b64encode
+    # a2b_base64 reads an ASCII str in place; base64.b64decode would first
+    # copy it into an intermediate bytes object.
+    from binascii import a2b_base64 as _b64decode
 
 from chuk_artifacts.exceptions import ProviderError
 from chuk_mcp_runtime.artifacts import ArtifactStore
@@ -27,35 +38,41 @@ from chuk_mcp_runtime.session.session_management import validate_session_paramet
 from pydantic import ValidationError
 
 from .models import (
-    ArtifactInfo,
     CopyFileInput,
-    CopyFileResult,
     DeleteFileInput,
-    DeleteFileResult,
     DownloadFileInput,
-    DownloadFileResult,
     GetMetadataInput,
     ListDirectoryInput,
-    ListDirectoryResult,
     ListSessionFilesInput,
-    ListSessionFilesResult,
-    MoveFileInput,
-    MoveFileResult,
-    ReadFileInput,
-    ReadFileResult,
     UpdateMetadataInput,
-    UpdateMetadataResult,
     UploadFileInput,
-    UploadFileResult,
     WriteFileInput,
-    WriteFileResult,
 )
 
+_T = TypeVar("_T")
+
+# Artefacts above this size are served via presigned URL, not inline base64
+_INLINE_LIMIT = 256 * 1024
+
 # ────────────────────────────────────────────────────────────────
 #  Logger & store
 # ────────────────────────────────────────────────────────────────
 logger = logging.getLogger("mcp-artifact-server")
-logger.setLevel(logging.DEBUG)
+
+
+def _log_level(value: str) -> int:
+    """Parse a LOG_LEVEL value (name or number); unknown names fall back to INFO."""
+    value = value.strip().upper()
+    if value.isdigit():
+        return int(value)
+    level = logging.getLevelNamesMapping().get(value)
+    if level is None:
+        logger.warning("Unknown LOG_LEVEL %r – using INFO", value)
+        return logging.INFO
+    return level
+
+
+logger.setLevel(_log_level(os.getenv("LOG_LEVEL", "INFO")))
 
 STORE = ArtifactStore()
 
@@ -64,6 +81,9 @@ STORE = ArtifactStore()
 # ────────────────────────────────────────────────────────────────
 def _log_startup_config(store: ArtifactStore) -> None:
     """Log effective storage/session configuration (secrets redacted)."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
     provider   = os.getenv("ARTIFACT_PROVIDER", "<unset>")
     bucket     = os.getenv("ARTIFACT_BUCKET",  "<unset>")
     region     = os.getenv("AWS_REGION",       "<unset>")
@@ -92,40 +112,142 @@ def _log_startup_config(store: ArtifactStore) -> None:
 
 _log_startup_config(STORE)
 
+# ────────────────────────────────────────────────────────────────
+#  Pre-built validators
+#  (bound once so tool calls skip the BaseModel.__init__ wrapper)
+#
+#  Responses are returned as plain dicts; the *Result models in
+#  models.py only document the response schema.
+# ────────────────────────────────────────────────────────────────
+_LIST_SESSION_VALIDATOR  = ListSessionFilesInput.__pydantic_validator__
+_LIST_DIR_VALIDATOR      = ListDirectoryInput.__pydantic_validator__
+_UPLOAD_VALIDATOR        = UploadFileInput.__pydantic_validator__
+_WRITE_VALIDATOR         = WriteFileInput.__pydantic_validator__
+_DOWNLOAD_VALIDATOR      = DownloadFileInput.__pydantic_validator__
+_GET_META_VALIDATOR      = GetMetadataInput.__pydantic_validator__
+_UPDATE_META_VALIDATOR   = UpdateMetadataInput.__pydantic_validator__
+_DELETE_VALIDATOR        = DeleteFileInput.__pydantic_validator__
+_COPY_VALIDATOR          = CopyFileInput.__pydantic_validator__
+
+# ────────────────────────────────────────────────────────────────
+#  Short-lived metadata cache
+#  (read paths only; mutating tools invalidate the ids they touch)
+# ────────────────────────────────────────────────────────────────
+_META_CACHE_TTL  = 5.0
+_META_CACHE_SIZE = 1024
+_META_CACHE: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
+
+
+async def _cached_metadata(artifact_id: str) -> Dict[str, Any]:
+    """`STORE.metadata()` behind a small LRU with a short TTL."""
+    now = time.monotonic()
+    hit = _META_CACHE.get(artifact_id)
+    if hit is not None and hit[0] > now:
+        _META_CACHE.move_to_end(artifact_id)
+        return hit[1]
+
+    meta = await STORE.metadata(artifact_id)
+    _META_CACHE[artifact_id] = (now + _META_CACHE_TTL, meta)
+    _META_CACHE.move_to_end(artifact_id)
+    if len(_META_CACHE) > _META_CACHE_SIZE:
+        _META_CACHE.popitem(last=False)
+    return meta
+
+
+def _forget_metadata(*artifact_ids: Optional[str]) -> None:
+    """Drop cached metadata for artefacts that were changed or removed."""
+    for aid in artifact_ids:
+        if aid:
+            _META_CACHE.pop(aid, None)
+
 # ────────────────────────────────────────────────────────────────
 #  Helper functions
 # ────────────────────────────────────────────────────────────────
-async def _info(
-    meta: Dict[str, Any],
-    fallback_id: Optional[str] = None,
-    fallback_session_id: Optional[str] = None,
-) -> ArtifactInfo:
-    """Convert raw store metadata → canonical `ArtifactInfo`."""
+def _artifact_id(meta: Dict[str, Any], fallback_id: Optional[str] = None) -> str:
+    """Derive the artefact id from raw metadata (id, artifact_id or S3 key)."""
+    key    = meta.get("key")
     art_id = (
         meta.get("artifact_id")
         or meta.get("id")
-        or (meta.get("key") or "").split("/")[-1]
+        or (key.rpartition("/")[2] if key else "")
         or fallback_id
     )
     if not art_id:
         raise KeyError("artifact_id")
+    return art_id
 
-    return ArtifactInfo.model_validate(
-        {
-            "artifact_id": art_id,
-            "filename": meta.get("filename"),
-            "mime": meta["mime"],
-            "bytes": meta["bytes"],
-            "summary": meta.get("summary"),
-            "stored_at": meta["stored_at"],
-            "session_id": meta.get("session_id") or fallback_session_id,
-            "meta": meta.get("meta", {}),
-        }
-    )
+
+def _info(
+    meta: Dict[str, Any],
+    fallback_id: Optional[str] = None,
+    fallback_session_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Convert raw store metadata → canonical `ArtifactInfo`-shaped dict.
+
+    Backend metadata is trusted, so the dict is built directly rather than
+    validated through the pydantic model.  The result is always a fresh dict
+    that callers may extend in place.
+    """
+    return {
+        "artifact_id": _artifact_id(meta, fallback_id),
+        "filename": meta.get("filename"),
+        "mime": meta["mime"],
+        "bytes": meta["bytes"],
+        "summary": meta.get("summary"),
+        "stored_at": meta["stored_at"],
+        "session_id": meta.get("session_id") or fallback_session_id,
+        # copied: meta may be a cached backend dict, and callers own the result
+        "meta": dict(meta.get("meta") or {}),
+    }
+
+
+async def _safe(aw: Awaitable[_T]) -> Optional[_T]:
+    """Await *aw*, returning None instead of raising (for best-effort calls)."""
+    try:
+        return await aw
+    except Exception:
+        return None
 
 
-async def _presign_or_inline(artifact_id: str, presign: bool) -> Dict[str, str | None]:
-    """Return medium-TTL presigned URL or inline base64 payload."""
+async def _metadata_and_url(artifact_id: str) -> tuple[Dict[str, Any], Optional[str]]:
+    """Fetch metadata and a short presigned URL concurrently (URL may be None)."""
+    meta_raw, url = await asyncio.gather(
+        STORE.metadata(artifact_id),
+        _safe(STORE.presign_short(artifact_id)),
+    )
+    return meta_raw, url
+
+
+async def _hydrate(meta_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Ensure every listing entry carries full metadata.
+
+    Backends normally return complete metadata from a listing; entries that
+    only carry an id are fetched concurrently rather than one by one.
+    """
+    missing = [i for i, m in enumerate(meta_list) if "mime" not in m or "bytes" not in m]
+    if not missing:
+        return meta_list
+
+    # derive every id before creating coroutines, so a KeyError cannot leave
+    # already-created metadata() coroutines un-awaited
+    ids = [_artifact_id(meta_list[i]) for i in missing]
+    fetched = await asyncio.gather(*(STORE.metadata(aid) for aid in ids))
+    meta_list = list(meta_list)
+    for i, full in zip(missing, fetched):
+        meta_list[i] = full
+    return meta_list
+
+
+async def _presign_or_inline(
+    artifact_id: str, presign: bool,
+    size: Optional[int] = None, inline_limit: Optional[int] = None,
+) -> Dict[str, str | None]:
+    """Return medium-TTL presigned URL or inline base64 payload.
+
+    If a presign was requested but fails, the inline fallback is only taken
+    when *inline_limit* is None or the artefact's *size* is within it;
+    otherwise ValueError is raised instead of retrieving and encoding it.
+    """
     if presign:
         try:
             return {
@@ -133,24 +255,28 @@ async def _presign_or_inline(artifact_id: str, presign: bool) -> Dict[str, str |
                 "data_base64": None,
             }
         except Exception as exc:
+            if inline_limit is not None and (size is None or size > inline_limit):
+                raise ValueError(
+                    f"presign unavailable and artefact too large to inline: {exc}"
+                ) from exc
             logger.info("Presign unavailable – falling back to inline: %s", exc)
 
     data = await STORE.retrieve(artifact_id)
-    return {"download_url": None, "data_base64": base64.b64encode(data).decode()}
+    return {"download_url": None, "data_base64": _b64encode(data).decode("ascii")}
 
 
 async def _store_and_build_info(
     *, content: bytes, filename: str, mime: str, summary: str,
     session_id: str, meta: Dict[str, Any]
-) -> tuple[str, ArtifactInfo]:
-    """Shared utility for write_file & upload_file."""
+) -> tuple[str, Dict[str, Any], Optional[str]]:
+    """Shared utility for write_file & upload_file → (id, info, download_url)."""
     art_id   = await STORE.store(
         data=content, mime=mime, summary=summary,
         filename=filename, session_id=session_id, meta=meta
     )
-    meta_raw = await STORE.metadata(art_id)
-    info     = await _info(meta_raw, fallback_id=art_id, fallback_session_id=session_id)
-    return art_id, info
+    meta_raw, url = await _metadata_and_url(art_id)
+    info     = _info(meta_raw, fallback_id=art_id, fallback_session_id=session_id)
+    return art_id, info, url
 
 # ────────────────────────────────────────────────────────────────
 #  Session-aware listing tools
@@ -163,17 +289,17 @@ async def list_session_files(session_id: Optional[str] = None, prefix: Optional[
     """List files in a session with optional prefix filter."""
     try:
         sess = validate_session_parameter(session_id, "list_session_files")
-        inp  = ListSessionFilesInput(session_id=sess, prefix=prefix)
+        inp  = _LIST_SESSION_VALIDATOR.validate_python({"session_id": sess, "prefix": prefix})
     except ValidationError as exc:
         raise ValueError(f"Invalid input: {exc}") from exc
 
     try:
-        meta_list = await STORE.list_by_prefix(sess, inp.prefix or "", limit=1000)
-        artifacts = [await _info(m, fallback_session_id=sess) for m in meta_list]
+        meta_list = await _hydrate(await STORE.list_by_prefix(sess, inp.prefix or "", limit=1000))
+        artifacts = [_info(m, fallback_session_id=sess) for m in meta_list]
     except Exception as exc:
         raise ValueError(f"Failed to list session files: {exc}") from exc
 
-    return ListSessionFilesResult(count=len(artifacts), session_id=sess, artifacts=artifacts).model_dump()
+    return {"count": len(artifacts), "session_id": sess, "artifacts": artifacts}
 
 
 @mcp_tool(
@@ -184,17 +310,17 @@ async def list_directory(directory: str, session_id: Optional[str] = None) -> Di
     """List files in a pseudo-directory inside a session."""
     try:
         sess = validate_session_parameter(session_id, "list_directory")
-        inp  = ListDirectoryInput(directory=directory, session_id=sess)
+        inp  = _LIST_DIR_VALIDATOR.validate_python({"directory": directory, "session_id": sess})
     except ValidationError as exc:
         raise ValueError(f"Invalid directory input: {exc}") from exc
 
     try:
-        meta_list = await STORE.get_directory_contents(sess, inp.directory, limit=1000)
-        artifacts = [await _info(m, fallback_session_id=sess) for m in meta_list]
+        meta_list = await _hydrate(await STORE.get_directory_contents(sess, inp.directory, limit=1000))
+        artifacts = [_info(m, fallback_session_id=sess) for m in meta_list]
     except Exception as exc:
         raise ValueError(f"Failed to list directory: {exc}") from exc
 
-    return ListDirectoryResult(count=len(artifacts), session_id=sess, directory=directory, artifacts=artifacts).model_dump()
+    return {"count": len(artifacts), "session_id": sess, "directory": directory, "artifacts": artifacts}
 
 # ────────────────────────────────────────────────────────────────
 #  upload_file
@@ -210,29 +336,25 @@ async def upload_file(
 ) -> Dict:
     try:
         sess = validate_session_parameter(session_id, "upload_file")
-        inp  = UploadFileInput(
-            data_base64=data_base64, filename=filename, mime=mime,
-            summary=summary or "", session_id=sess, meta=meta or {}
-        )
+        inp  = _UPLOAD_VALIDATOR.validate_python({
+            "data_base64": data_base64, "filename": filename, "mime": mime,
+            "summary": summary or "", "session_id": sess, "meta": meta or {},
+        })
     except ValidationError as exc:
         raise ValueError(f"Invalid upload input: {exc}") from exc
 
     try:
-        content = base64.b64decode(inp.data_base64)
+        content = _b64decode(inp.data_base64)
     except Exception as exc:
         raise ValueError(f"data_base64 not valid base64: {exc}") from exc
 
-    art_id, info = await _store_and_build_info(
+    _, info, url = await _store_and_build_info(
         content=content, filename=inp.filename, mime=inp.mime,
         summary=inp.summary, session_id=sess, meta=inp.meta
     )
-
-    try:
-        url = await STORE.presign_short(art_id)
-    except Exception:
-        url = None
-
-    return UploadFileResult(**info.model_dump(), download_url=url).model_dump()
+    info["download_url"] = url
+    info["operation"]    = "create"
+    return info
 
 # ────────────────────────────────────────────────────────────────
 #  write_file  (safe overwrite)
@@ -249,49 +371,50 @@ async def write_file(
 ) -> Dict:
     try:
         sess = validate_session_parameter(session_id, "write_file")
-        inp  = WriteFileInput(
-            content=content, filename=filename, mime=mime,
-            summary=summary or f"Written file: {filename}",
-            session_id=sess, meta=meta or {}, encoding=encoding,
-            overwrite_artifact_id=overwrite_artifact_id
-        )
+        inp  = _WRITE_VALIDATOR.validate_python({
+            "content": content, "filename": filename, "mime": mime,
+            "summary": summary or f"Written file: {filename}",
+            "session_id": sess, "meta": meta or {}, "encoding": encoding,
+            "overwrite_artifact_id": overwrite_artifact_id,
+        })
     except ValidationError as exc:
         raise ValueError(f"Invalid write input: {exc}") from exc
 
-    # Attempt normal write / overwrite
     try:
-        art_id = await STORE.write_file(
-            inp.content, filename=inp.filename, mime=inp.mime, summary=inp.summary,
-            session_id=sess, meta=inp.meta, encoding=inp.encoding,
-            overwrite_artifact_id=inp.overwrite_artifact_id
-        )
-        meta_raw = await STORE.metadata(art_id)
-        info     = await _info(meta_raw, fallback_id=art_id, fallback_session_id=sess)
-
-    # Graceful overwrite fallback
-    except ProviderError as exc:
-        msg = str(exc)
-        if overwrite_artifact_id and "Cross-session overwrite not permitted" in msg and "belongs to session 'None'" in msg:
-            try:
-                await STORE.delete(overwrite_artifact_id)
-            except Exception:
-                logger.warning("Failed to delete old artefact %s", overwrite_artifact_id)
-
-            art_id, info = await _store_and_build_info(
-                content=inp.content.encode(inp.encoding),
-                filename=inp.filename, mime=inp.mime, summary=inp.summary,
-                session_id=sess, meta=inp.meta
+        # Attempt normal write / overwrite
+        try:
+            art_id = await STORE.write_file(
+                inp.content, filename=inp.filename, mime=inp.mime, summary=inp.summary,
+                session_id=sess, meta=inp.meta, encoding=inp.encoding,
+                overwrite_artifact_id=inp.overwrite_artifact_id
             )
-        else:
-            raise ValueError(str(exc)) from exc
-
-    try:
-        url = await STORE.presign_short(art_id)
-    except Exception:
-        url = None
+            meta_raw, url = await _metadata_and_url(art_id)
+            info     = _info(meta_raw, fallback_id=art_id, fallback_session_id=sess)
+
+        # Graceful overwrite fallback
+        except ProviderError as exc:
+            msg = str(exc)
+            if overwrite_artifact_id and "Cross-session overwrite not permitted" in msg and "belongs to session 'None'" in msg:
+                try:
+                    await STORE.delete(overwrite_artifact_id)
+                except Exception:
+                    logger.warning("Failed to delete old artefact %s", overwrite_artifact_id)
+
+                _, info, url = await _store_and_build_info(
+                    content=inp.content.encode(inp.encoding),
+                    filename=inp.filename, mime=inp.mime, summary=inp.summary,
+                    session_id=sess, meta=inp.meta
+                )
+            else:
+                raise ValueError(str(exc)) from exc
+    finally:
+        # the backend may already have deleted the old artefact, even on failure
+        _forget_metadata(overwrite_artifact_id)
 
     op = "overwrite" if overwrite_artifact_id else "create"
-    return WriteFileResult(**info.model_dump(), download_url=url, operation=op).model_dump()
+    info["download_url"] = url
+    info["operation"]    = op
+    return info
 
 # ────────────────────────────────────────────────────────────────
 #  download_file
@@ -300,18 +423,20 @@ async def write_file(
 async def download_file(artifact_id: str, presign: bool = True) -> Dict:
     """Retrieve or presign a stored artefact."""
     try:
-        inp = DownloadFileInput(artifact_id=artifact_id, presign=presign)
+        inp = _DOWNLOAD_VALIDATOR.validate_python({"artifact_id": artifact_id, "presign": presign})
     except ValidationError as exc:
         raise ValueError(f"Invalid download input: {exc}") from exc
 
     try:
-        meta = await STORE.metadata(inp.artifact_id)
+        meta = await _cached_metadata(inp.artifact_id)
     except Exception as exc:
         raise ValueError(str(exc)) from exc
 
-    info  = await _info(meta, fallback_id=inp.artifact_id, fallback_session_id=meta.get("session_id"))
-    extra = await _presign_or_inline(inp.artifact_id, inp.presign)
-    return DownloadFileResult(artifact=info, **extra).model_dump()
+    info  = _info(meta, fallback_id=inp.artifact_id)
+    extra = await _presign_or_inline(
+        inp.artifact_id, inp.presign, size=meta.get("bytes"), inline_limit=_INLINE_LIMIT
+    )
+    return {"artifact": info, **extra}
 
 # ────────────────────────────────────────────────────────────────
 #  get_metadata
@@ -320,16 +445,16 @@ async def download_file(artifact_id: str, presign: bool = True) -> Dict:
 async def get_metadata(artifact_id: str) -> Dict:
     """Return stored metadata for an artefact."""
     try:
-        inp = GetMetadataInput(artifact_id=artifact_id)
+        inp = _GET_META_VALIDATOR.validate_python({"artifact_id": artifact_id})
     except ValidationError as exc:
         raise ValueError(f"Invalid input: {exc}") from exc
 
     try:
-        meta = await STORE.metadata(inp.artifact_id)
+        meta = await _cached_metadata(inp.artifact_id)
     except Exception as exc:
         raise ValueError(str(exc)) from exc
 
-    return (await _info(meta, fallback_id=inp.artifact_id, fallback_session_id=meta.get("session_id"))).model_dump()
+    return _info(meta, fallback_id=inp.artifact_id)
 
 # ────────────────────────────────────────────────────────────────
 #  update_metadata
@@ -338,19 +463,18 @@ async def get_metadata(artifact_id: str) -> Dict:
 async def update_metadata(artifact_id: str, meta: Dict[str, Any]) -> Dict:
     """Merge new metadata into an existing artefact."""
     try:
-        inp = UpdateMetadataInput(artifact_id=artifact_id, meta=meta)
+        inp = _UPDATE_META_VALIDATOR.validate_python({"artifact_id": artifact_id, "meta": meta})
     except ValidationError as exc:
         raise ValueError(f"Invalid update input: {exc}") from exc
 
     try:
         await STORE.update_metadata(inp.artifact_id, new_meta=inp.meta, merge=True)
+        _forget_metadata(inp.artifact_id)
         meta_full = await STORE.metadata(inp.artifact_id)
     except Exception as exc:
         raise ValueError(str(exc)) from exc
 
-    return UpdateMetadataResult(
-        **(await _info(meta_full, fallback_id=inp.artifact_id, fallback_session_id=meta_full.get("session_id"))).model_dump()
-    ).model_dump()
+    return _info(meta_full, fallback_id=inp.artifact_id)
 
 # ────────────────────────────────────────────────────────────────
 #  delete_file
@@ -359,7 +483,7 @@ async def update_metadata(artifact_id: str, meta: Dict[str, Any]) -> Dict:
 async def delete_file(artifact_id: str) -> Dict:
     """Delete an artefact."""
     try:
-        inp = DeleteFileInput(artifact_id=artifact_id)
+        inp = _DELETE_VALIDATOR.validate_python({"artifact_id": artifact_id})
     except ValidationError as exc:
         raise ValueError(f"Invalid delete input: {exc}") from exc
 
@@ -367,8 +491,10 @@ async def delete_file(artifact_id: str) -> Dict:
         success = await STORE.delete(inp.artifact_id)
     except Exception as exc:
         raise ValueError(str(exc)) from exc
+    finally:
+        _forget_metadata(inp.artifact_id)
 
-    return DeleteFileResult(success=bool(success), artifact_id=artifact_id).model_dump()
+    return {"success": bool(success), "artifact_id": artifact_id}
 
 # ────────────────────────────────────────────────────────────────
 #  copy_file
@@ -379,22 +505,24 @@ async def copy_file(
 ) -> Dict:
     """Copy a file within its current session."""
     try:
-        inp = CopyFileInput(artifact_id=artifact_id, filename=filename, session_id=None, meta=meta or {})
+        inp = _COPY_VALIDATOR.validate_python(
+            {"artifact_id": artifact_id, "filename": filename, "session_id": None, "meta": meta or {}}
+        )
     except ValidationError as exc:
         raise ValueError(f"Invalid copy input: {exc}") from exc
 
     try:
-        new_id = await STORE.copy_file(
+        new_id   = await STORE.copy_file(
             inp.artifact_id, new_filename=inp.filename, target_session_id=None, new_meta=inp.meta
         )
         meta_new = await STORE.metadata(new_id)
     except Exception as exc:
         raise ValueError(str(exc)) from exc
 
-    return CopyFileResult(
-        **(await _info(meta_new, fallback_id=new_id, fallback_session_id=meta_new.get("session_id"))).model_dump(),
-        source_artifact_id=inp.artifact_id,
-    ).model_dump()
+    info = _info(meta_new, fallback_id=new_id)
+    info["source_artifact_id"] = inp.artifact_id
+    info["operation"]          = "copy"
+    return info
 
 # ────────────────────────────────────────────────────────────────
 #  move_file
@@ -408,11 +536,13 @@ async def move_file(
         updated_meta = await STORE.move_file(
             artifact_id, new_filename=new_filename, new_meta=new_meta or {}
         )
-        info = await _info(updated_meta, fallback_id=artifact_id, fallback_session_id=updated_meta.get("session_id"))
+        _forget_metadata(artifact_id)
+        info = _info(updated_meta, fallback_id=artifact_id)
     except Exception as exc:
         raise ValueError(str(exc)) from exc
 
-    return MoveFileResult(**info.model_dump(), operation="move").model_dump()
+    info["operation"] = "move"
+    return info
 
 # ────────────────────────────────────────────────────────────────
 #  read_file
@@ -421,20 +551,46 @@ async def move_file(
 async def read_file(
     artifact_id: str, as_text: bool = True, encoding: str = "utf-8"
 ) -> Dict:
-    """Read file content."""
+    """Read file content.
+
+    Large binary artefacts are returned as a presigned URL instead of being
+    loaded and base64-encoded in memory; inline base64 is only used for
+    small blobs or when presigning is unavailable.
+    """
+    if not as_text:
+        try:
+            size = (await _cached_metadata(artifact_id))["bytes"]
+        except Exception as exc:
+            raise ValueError(str(exc)) from exc
+
+        if size > _INLINE_LIMIT:
+            url = await _safe(STORE.presign_medium(artifact_id))
+            if url:
+                return {
+                    "artifact_id": artifact_id, "content_type": "binary", "content": None,
+                    "content_base64": None, "encoding": None, "bytes": size,
+                    "download_url": url,
+                }
+            logger.info("Presign unavailable – reading %s inline (%d bytes)", artifact_id, size)
+
     try:
         content = await STORE.read_file(artifact_id, as_text=as_text, encoding=encoding)
     except Exception as exc:
         raise ValueError(str(exc)) from exc
 
     if as_text:
-        return ReadFileResult(
-            artifact_id=artifact_id, content_type="text", content=content, encoding=encoding
-        ).model_dump()
-
-    return ReadFileResult(
-        artifact_id=artifact_id,
-        content_type="binary",
-        content_base64=base64.b64encode(content).decode(),
-        bytes=len(content),
-    ).model_dump()
+        return {
+            "artifact_id": artifact_id, "content_type": "text", "content": content,
+            "content_base64": None, "encoding": encoding, "bytes": None,
+            "download_url": None,
+        }
+
+    return {
+        "artifact_id": artifact_id,
+        "content_type": "binary",
+        "content": None,
+        "content_base64": _b64encode(content).decode("ascii"),
+        "encoding": None,
+        "bytes": len(content),
+        "download_url": None,
+    }
@@ -0,0 +1,216 @@
+# tests/conftest.py
+"""
+Shared fixtures for the unit tests.
+
+Unit tests run purely in memory: every test gets a FakeStore as tools.STORE
+and the fixture fails if anything other than a memory backend is installed.
+Tests that need a real (filesystem / S3) ArtifactStore belong under
+tests/integration/ and must be marked ``@pytest.mark.integration``.
+"""
+import copy
+import itertools
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+# module under test
+import chuk_mcp_artifact_server.tools as tools
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Fake in-memory store that mimics the subset of ArtifactStore used by tools
+# ─────────────────────────────────────────────────────────────────────────────
+class FakeStore:
+    BACKEND = "memory"  # checked by the fake_store fixture
+
+    # process-wide, so ids stay unique across per-test copies
+    _counter = itertools.count()
+
+    def __init__(self) -> None:
+        # key: artefact_id  -> meta dict
+        self._objects: Dict[str, Dict[str, Any]] = {}
+        # key: artefact_id  -> stored bytes
+        self._data: Dict[str, bytes] = {}
+        # key: session_id -> sorted [(filename, artefact_id)] for prefix seeks
+        self._by_session: Dict[Optional[str], List[Tuple[str, str]]] = {}
+
+    def __copy__(self) -> "FakeStore":
+        clone = FakeStore.__new__(FakeStore)
+        clone._objects = dict(self._objects)
+        clone._data = dict(self._data)
+        clone._by_session = {sess: list(names) for sess, names in self._by_session.items()}
+        return clone
+
+    # ---------- helpers -----------------------------------------------------
+    def _new_id(self) -> str:
+        return f"art{next(self._counter):012x}"
+
+    def _remove(self, artefact_id: str) -> Optional[Dict[str, Any]]:
+        meta = self._objects.pop(artefact_id, None)
+        self._data.pop(artefact_id, None)
+        if meta is not None:
+            names = self._by_session[meta["session_id"]]
+            del names[bisect_left(names, (meta["filename"], artefact_id))]
+        return meta
+
+    def _replace(self, artefact_id: str, **changes: Any) -> Dict[str, Any]:
+        # swap in a new dict (never mutate) so stale cached references stay stale
+        data = self._data[artefact_id]
+        updated = {**self._remove(artefact_id), **changes}
+        self._objects[artefact_id] = updated
+        self._data[artefact_id] = data
+        insort(self._by_session.setdefault(updated["session_id"], []), (updated["filename"], artefact_id))
+        return updated
+
+    # ---------- store / write ----------------------------------------------
+    async def store(  # upload_file path
+        self,
+        data: bytes,
+        mime: str,
+        summary: str,
+        filename: str,
+        session_id: str,
+        meta: Dict[str, Any],
+        size: Optional[int] = None,  # precomputed len(data), if the caller has it
+    ) -> str:
+        artefact_id = self._new_id()
+        self._objects[artefact_id] = {
+            "artifact_id": artefact_id,
+            "filename": filename,
+            "mime": mime,
+            "bytes": len(data) if size is None else size,
+            "summary": summary,
+            "stored_at": "2025-06-01T00:00:00Z",
+            "session_id": session_id,
+            "meta": meta,
+        }
+        self._data[artefact_id] = data
+        insort(self._by_session.setdefault(session_id, []), (filename, artefact_id))
+        return artefact_id
+
+    async def write_file(  # write_file path (handles overwrite)
+        self,
+        content: str,
+        filename: str,
+        mime: str,
+        summary: str,
+        session_id: str,
+        meta: Dict[str, Any],
+        encoding: str,
+        overwrite_artifact_id: str | None = None,
+    ) -> str:
+        if overwrite_artifact_id:
+            old = self._objects[overwrite_artifact_id]
+            if old["session_id"] not in (session_id, None):
+                # emulate ProviderError from real backend
+                raise tools.ProviderError(
+                    f"Cross-session overwrite not permitted. "
+                    f"Artifact {overwrite_artifact_id} belongs to session '{old['session_id']}', "
+                    f"cannot overwrite from session '{session_id}'."
+                )
+            # delete old -> graceful path in tools.write_file kicks in
+            self._remove(overwrite_artifact_id)
+
+        encoded = content.encode(encoding)
+        return await self.store(
+            data=encoded,
+            size=len(encoded),
+            mime=mime,
+            summary=summary,
+            filename=filename,
+            session_id=session_id,
+            meta=meta,
+        )
+
+    # ---------- read paths --------------------------------------------------
+    async def metadata(self, artefact_id: str) -> Dict[str, Any]:
+        return self._objects[artefact_id]
+
+    async def retrieve(self, artefact_id: str) -> bytes:  # for _presign_or_inline fallback
+        return self._data[artefact_id]
+
+    async def read_file(self, artefact_id: str, *, encoding: str = "utf-8", as_text: bool = True):
+        data = self._data[artefact_id]
+        return data.decode(encoding) if as_text else data
+
+    async def list_by_prefix(self, session_id: str, prefix: str, limit: int) -> List[Dict[str, Any]]:
+        names = self._by_session.get(session_id, [])
+        out: List[Dict[str, Any]] = []
+        for i in range(bisect_left(names, (prefix,)), len(names)):
+            filename, artefact_id = names[i]
+            if not filename.startswith(prefix) or len(out) >= limit:
+                break
+            out.append(self._objects[artefact_id])
+        return out
+
+    async def get_directory_contents(self, session_id: str, directory: str, limit: int) -> List[Dict[str, Any]]:
+        return await self.list_by_prefix(session_id, directory, limit)
+
+    # ---------- metadata / copy / move -------------------------------------
+    async def update_metadata(
+        self, artefact_id: str, *, new_meta: Dict[str, Any] | None = None, merge: bool = True, **_: Any
+    ) -> Dict[str, Any]:
+        old = self._objects[artefact_id]["meta"]
+        return self._replace(artefact_id, meta={**old, **(new_meta or {})} if merge else dict(new_meta or {}))
+
+    async def move_file(
+        self, artefact_id: str, *, new_filename: str | None = None, new_meta: Dict[str, Any] | None = None, **_: Any
+    ) -> Dict[str, Any]:
+        old = self._objects[artefact_id]
+        return self._replace(
+            artefact_id,
+            filename=new_filename or old["filename"],
+            meta={**old["meta"], **(new_meta or {})},
+        )
+
+    async def copy_file(
+        self,
+        artefact_id: str,
+        *,
+        new_filename: str | None = None,
+        target_session_id: str | None = None,
+        new_meta: Dict[str, Any] | None = None,
+        **_: Any,
+    ) -> str:
+        old = self._objects[artefact_id]
+        return await self.store(
+            data=self._data[artefact_id],
+            mime=old["mime"],
+            summary=old["summary"],
+            filename=new_filename or old["filename"],
+            session_id=target_session_id or old["session_id"],
+            meta={**old["meta"], **(new_meta or {})},
+        )
+
+    # ---------- misc --------------------------------------------------------
+    async def presign_short(self, artefact_id: str) -> str:
+        return f"https://example/{artefact_id}"
+
+    async def presign_medium(self, artefact_id: str) -> str:
+        return f"https://example/medium/{artefact_id}"
+
+    async def delete(self, artefact_id: str) -> bool:
+        return self._remove(artefact_id) is not None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Pytest fixtures
+# ─────────────────────────────────────────────────────────────────────────────
+@pytest.fixture(scope="session")
+def _proto_store():
+    """Canonical FakeStore built once per session (seed shared data here)."""
+    return FakeStore()
+
+
+@pytest.fixture(autouse=True)
+def fake_store(_proto_store):
+    """Patch tools.STORE with a fresh copy of the prototype for each test."""
+    fake = copy.copy(_proto_store)  # FakeStore.__copy__ clones objects + index
+    tools._META_CACHE.clear()
+
+    old = getattr(tools, "STORE", None)
+    tools.STORE = fake
+    assert getattr(tools.STORE, "BACKEND", None) == "memory", "unit tests must use the in-memory store"
+    yield fake  # tests receive the fake if they need direct introspection
+    tools.STORE = old
@@ -1,124 +1,15 @@
 # tests/test_artifact_tools.py
 import asyncio
 import base64
-import uuid
+import logging
 from types import SimpleNamespace
-from typing import Any, Dict, List
 
 import pytest
-import pytest_asyncio
 
 # module under test
 import chuk_mcp_artifact_server.tools as tools
 
 
-# ─────────────────────────────────────────────────────────────────────────────
-# Fake in-memory store that mimics the subset of ArtifactStore used by tools
-# ─────────────────────────────────────────────────────────────────────────────
-class FakeStore:
-    def __init__(self) -> None:
-        # key: artefact_id  -> meta dict
-        self._objects: Dict[str, Dict[str, Any]] = {}
-
-    # ---------- helpers -----------------------------------------------------
-    @staticmethod
-    def _new_id() -> str:
-        return uuid.uuid4().hex
-
-    # ---------- store / write ----------------------------------------------
-    async def store(  # upload_file path
-        self,
-        data: bytes,
-        mime: str,
-        summary: str,
-        filename: str,
-        session_id: str,
-        meta: Dict[str, Any],
-    ) -> str:
-        artefact_id = self._new_id()
-        self._objects[artefact_id] = {
-            "artifact_id": artefact_id,
-            "filename": filename,
-            "mime": mime,
-            "bytes": len(data),
-            "summary": summary,
-            "stored_at": "2025-06-01T00:00:00Z",
-            "session_id": session_id,
-            "meta": meta,
-        }
-        return artefact_id
-
-    async def write_file(  # write_file path (handles overwrite)
-        self,
-        content: str,
-        filename: str,
-        mime: str,
-        summary: str,
-        session_id: str,
-        meta: Dict[str, Any],
-        encoding: str,
-        overwrite_artifact_id: str | None = None,
-    ) -> str:
-        if overwrite_artifact_id:
-            old = self._objects[overwrite_artifact_id]
-            if old["session_id"] not in (session_id, None):
-                # emulate ProviderError from real backend
-                raise tools.ProviderError(
-                    f"Cross-session overwrite not permitted. "
-                    f"Artifact {overwrite_artifact_id} belongs to session '{old['session_id']}', "
-                    f"cannot overwrite from session '{session_id}'."
-                )
-            # delete old -> graceful path in tools.write_file kicks in
-            self._objects.pop(overwrite_artifact_id, None)
-
-        return await self.store(
-            data=content.encode(encoding),
-            mime=mime,
-            summary=summary,
-            filename=filename,
-            session_id=session_id,
-            meta=meta,
-        )
-
-    # ---------- read paths --------------------------------------------------
-    async def metadata(self, artefact_id: str) -> Dict[str, Any]:
-        return self._objects[artefact_id]
-
-    async def retrieve(self, artefact_id: str) -> bytes:  # for _presign_or_inline fallback
-        return b"dummy"
-
-    async def list_by_prefix(self, session_id: str, prefix: str, limit: int) -> List[Dict[str, Any]]:
-        return [
-            meta
-            for meta in self._objects.values()
-            if meta["session_id"] == session_id and meta["filename"].startswith(prefix)
-        ]
-
-    async def get_directory_contents(self, session_id: str, directory: str, limit: int) -> List[Dict[str, Any]]:
-        return await self.list_by_prefix(session_id, directory, limit)
-
-    # ---------- misc --------------------------------------------------------
-    async def presign_short(self, artefact_id: str) -> str:
-        return f"https://example/{artefact_id}"
-
-    async def presign_medium(self, artefact_id: str) -> str:
-        return f"https://example/medium/{artefact_id}"
-
-    async def delete(self, artefact_id: str) -> bool:
-        return self._objects.pop(artefact_id, None) is not None
-
-
-# ─────────────────────────────────────────────────────────────────────────────
-# Pytest fixtures
-# ─────────────────────────────────────────────────────────────────────────────
-@pytest_asyncio.fixture(autouse=True)
-async def fake_store(monkeypatch):
-    """Patch tools.STORE with an in-memory fake for the duration of each test."""
-    fake = FakeStore()
-    monkeypatch.setattr(tools, "STORE", fake)
-    yield fake  # tests receive the fake if they need direct introspection
-
-
 # ─────────────────────────────────────────────────────────────────────────────
 # Actual tests
 # ─────────────────────────────────────────────────────────────────────────────
@@ -146,15 +37,19 @@ async def test_write_and_list_session(fake_store):
 async def test_graceful_overwrite_of_legacy_object(fake_store):
     session_id = "team42"
 
-    # create legacy object with session_id=None
-    legacy_id = await fake_store.store(
-        data=b"old",
-        mime="text/plain",
-        summary="legacy",
-        filename="doc.txt",
-        session_id=None,  # ← legacy missing session
-        meta={},
+    # create legacy object with session_id=None; baseline listing is independent
+    legacy_id, baseline = await asyncio.gather(
+        fake_store.store(
+            data=b"old",
+            mime="text/plain",
+            summary="legacy",
+            filename="doc.txt",
+            session_id=None,  # ← legacy missing session
+            meta={},
+        ),
+        tools.list_session_files(session_id=session_id),
     )
+    assert baseline["count"] == 0  # legacy object is not visible in the session
 
     # overwrite via tools.write_file (should delete & rewrite transparently)
     new = await tools.write_file(
@@ -176,3 +71,283 @@ async def test_graceful_overwrite_of_legacy_object(fake_store):
     ids = [a["artifact_id"] for a in listing["artifacts"]]
     assert new["artifact_id"] in ids
     assert legacy_id not in fake_store._objects  # deleted
+
+
+@pytest.mark.asyncio
+async def test_listing_hydrates_id_only_entries(fake_store, monkeypatch):
+    session_id = "hydrate"
+    written = await tools.write_file(content="abc", filename="a.txt", session_id=session_id)
+
+    async def id_only(session_id, prefix, limit):
+        return [{"artifact_id": written["artifact_id"]}]
+
+    monkeypatch.setattr(fake_store, "list_by_prefix", id_only)
+
+    listing = await tools.list_session_files(session_id=session_id)
+    assert listing["count"] == 1
+    art = listing["artifacts"][0]
+    assert art["artifact_id"] == written["artifact_id"]
+    assert art["mime"] == "text/plain"
+    assert art["bytes"] == 3
+    assert art["filename"] == "a.txt"
+
+
+@pytest.mark.asyncio
+async def test_upload_round_trip(fake_store):
+    raw = bytes(range(256)) * 4
+    result = await tools.upload_file(
+        data_base64=base64.b64encode(raw).decode(),
+        filename="blob.bin",
+        mime="application/octet-stream",
+        session_id="up",
+    )
+    assert result["operation"] == "create"
+    assert result["bytes"] == len(raw)
+    assert result["download_url"] == f"https://example/{result['artifact_id']}"
+    assert fake_store._data[result["artifact_id"]] == raw
+
+
+@pytest.mark.asyncio
+async def test_upload_download_round_trip_with_loaded_codec(fake_store):
+    # exercises whichever codec tools imported (pybase64 or the stdlib fallback)
+    raw = bytes(range(256)) * 3 + b"tail"
+    uploaded = await tools.upload_file(
+        data_base64=base64.b64encode(raw).decode(),
+        filename="codec.bin",
+        mime="application/octet-stream",
+        session_id="codec",
+    )
+    downloaded = await tools.download_file(uploaded["artifact_id"], presign=False)
+    assert base64.b64decode(downloaded["data_base64"]) == raw
+    assert downloaded["artifact"]["bytes"] == len(raw)
+
+
+@pytest.mark.asyncio
+async def test_upload_rejects_invalid_base64(fake_store):
+    with pytest.raises(ValueError, match="data_base64 not valid base64"):
+        await tools.upload_file(
+            data_base64="a", filename="bad.bin", mime="application/octet-stream", session_id="up"
+        )
+    assert not fake_store._objects
+
+
+def test_log_level_parsing(caplog):
+    assert tools._log_level("debug") == logging.DEBUG
+    assert tools._log_level(" 10 ") == 10
+    with caplog.at_level(logging.WARNING, logger="mcp-artifact-server"):
+        assert tools._log_level("verbose") == logging.INFO
+    assert "Unknown LOG_LEVEL 'VERBOSE'" in caplog.text
+
+
+@pytest.mark.parametrize("level, expect_reads", [(logging.INFO, False), (logging.DEBUG, True)])
+def test_startup_diagnostics_only_at_debug(monkeypatch, level, expect_reads):
+    reads = []
+    monkeypatch.setattr(tools, "os", SimpleNamespace(getenv=lambda k, d=None: reads.append(k) or d))
+    old = tools.logger.level
+    tools.logger.setLevel(level)
+    try:
+        tools._log_startup_config(SimpleNamespace())
+    finally:
+        tools.logger.setLevel(old)
+    assert bool(reads) is expect_reads
+
+
+@pytest.fixture
+def no_presign(fake_store, monkeypatch):
+    async def fail(artefact_id):
+        raise RuntimeError("presign unsupported")
+
+    monkeypatch.setattr(fake_store, "presign_medium", fail)
+
+
+async def _store_blob(fake_store, size: int) -> str:
+    return await fake_store.store(
+        data=b"x" * size, mime="application/octet-stream", summary="", filename=f"{size}.bin",
+        session_id="blobs", meta={},
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_file_small_binary_is_inline(fake_store):
+    aid = await _store_blob(fake_store, 10)
+    result = await tools.read_file(aid, as_text=False)
+    assert result["content_base64"] == base64.b64encode(b"x" * 10).decode()
+    assert result["bytes"] == 10
+    assert result["download_url"] is None
+
+
+@pytest.mark.asyncio
+async def test_read_file_large_binary_returns_url(fake_store):
+    size = tools._INLINE_LIMIT + 1
+    aid = await _store_blob(fake_store, size)
+    result = await tools.read_file(aid, as_text=False)
+    assert result["download_url"] == f"https://example/medium/{aid}"
+    assert result["content_base64"] is None
+    assert result["bytes"] == size
+
+
+@pytest.mark.asyncio
+async def test_read_file_large_binary_falls_back_inline(fake_store, no_presign):
+    size = tools._INLINE_LIMIT + 1
+    aid = await _store_blob(fake_store, size)
+    result = await tools.read_file(aid, as_text=False)
+    assert result["download_url"] is None
+    assert base64.b64decode(result["content_base64"]) == b"x" * size
+    assert result["bytes"] == size
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "tool, kwargs, message",
+    [
+        (tools.write_file, {"meta": ["not", "a", "dict"]}, "Invalid write input"),
+        (tools.write_file, {"summary": 123}, "Invalid write input"),
+        (tools.write_file, {"encoding": None}, "Invalid write input"),
+        (tools.write_file, {"overwrite_artifact_id": 7}, "Invalid write input"),
+        (tools.upload_file, {"meta": "str-meta"}, "Invalid upload input"),
+        (tools.upload_file, {"summary": 123}, "Invalid upload input"),
+        (tools.list_session_files, {"prefix": 5}, "Invalid input"),
+        (tools.list_directory, {"directory": 5}, "Invalid directory input"),
+    ],
+)
+async def test_tools_reject_mistyped_arguments(fake_store, tool, kwargs, message):
+    base = {
+        tools.write_file: {"content": "x", "filename": "x.txt"},
+        tools.upload_file: {"data_base64": "eA==", "filename": "x.bin", "mime": "application/octet-stream"},
+        tools.list_session_files: {},
+        tools.list_directory: {},
+    }[tool]
+    with pytest.raises(ValueError, match=message):
+        await tool(session_id="typed", **{**base, **kwargs})
+    assert not fake_store._objects
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Metadata cache
+# ─────────────────────────────────────────────────────────────────────────────
+async def _cached_artefact(session_id: str = "cache") -> str:
+    written = await tools.write_file(content="v1", filename="c.txt", session_id=session_id, meta={"v": 1})
+    await tools.get_metadata(written["artifact_id"])  # prime the cache
+    return written["artifact_id"]
+
+
+@pytest.mark.asyncio
+async def test_get_metadata_fresh_after_update_metadata(fake_store):
+    aid = await _cached_artefact()
+    await tools.update_metadata(aid, {"v": 2})
+    assert (await tools.get_metadata(aid))["meta"] == {"v": 2}
+
+
+@pytest.mark.asyncio
+async def test_get_metadata_fresh_after_move_file(fake_store):
+    aid = await _cached_artefact()
+    await tools.move_file(aid, new_filename="moved.txt")
+    assert (await tools.get_metadata(aid))["filename"] == "moved.txt"
+
+
+@pytest.mark.asyncio
+async def test_get_metadata_raises_after_delete_file(fake_store):
+    aid = await _cached_artefact()
+    assert (await tools.delete_file(aid))["success"] is True
+    with pytest.raises(ValueError):
+        await tools.get_metadata(aid)
+
+
+@pytest.mark.asyncio
+async def test_get_metadata_raises_after_overwrite(fake_store):
+    aid = await _cached_artefact()
+    new = await tools.write_file(
+        content="v2", filename="c.txt", session_id="cache", overwrite_artifact_id=aid
+    )
+    assert new["operation"] == "overwrite"
+    with pytest.raises(ValueError):
+        await tools.get_metadata(aid)
+    assert (await tools.get_metadata(new["artifact_id"]))["bytes"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fallback", [False, True], ids=["write-error", "fallback-store-error"])
+async def test_failed_overwrite_still_invalidates_cache(fake_store, monkeypatch, fallback):
+    aid = await _cached_artefact()
+
+    async def delete_then_fail(*args, overwrite_artifact_id=None, **kwargs):
+        # like chuk_artifacts: the old artefact is deleted before the new store fails
+        fake_store._remove(overwrite_artifact_id)
+        if fallback:
+            raise tools.ProviderError(
+                f"Cross-session overwrite not permitted. Artifact {overwrite_artifact_id} "
+                "belongs to session 'None'"
+            )
+        raise tools.ProviderError("store failed after delete")
+
+    async def store_fails(**kwargs):
+        raise tools.ProviderError("fallback store failed")
+
+    monkeypatch.setattr(fake_store, "write_file", delete_then_fail)
+    monkeypatch.setattr(fake_store, "store", store_fails)
+
+    with pytest.raises((ValueError, tools.ProviderError)):
+        await tools.write_file(
+            content="v2", filename="c.txt", session_id="cache", overwrite_artifact_id=aid
+        )
+    with pytest.raises(ValueError):
+        await tools.get_metadata(aid)
+
+
+@pytest.mark.asyncio
+async def test_copy_file_returns_new_artefact(fake_store):
+    aid = await _cached_artefact()
+    copy = await tools.copy_file(aid, filename="copy.txt", meta={"copied": True})
+    assert copy["artifact_id"] != aid
+    assert copy["source_artifact_id"] == aid
+    assert copy["meta"] == {"v": 1, "copied": True}
+
+
+@pytest.mark.asyncio
+async def test_metadata_cache_expires_after_ttl(fake_store, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(tools.time, "monotonic", lambda: now[0])
+    aid = await _cached_artefact()
+
+    # change the backend behind the cache's back
+    fake_store._objects[aid] = {**fake_store._objects[aid], "summary": "changed"}
+    assert (await tools.get_metadata(aid))["summary"] != "changed"  # still cached
+
+    now[0] += tools._META_CACHE_TTL + 0.1
+    assert (await tools.get_metadata(aid))["summary"] == "changed"
+
+
+@pytest.mark.asyncio
+async def test_mutating_response_does_not_corrupt_cache(fake_store):
+    aid = await _cached_artefact()
+    (await tools.get_metadata(aid))["meta"]["v"] = "tampered"
+    assert (await tools.get_metadata(aid))["meta"] == {"v": 1}
+    assert fake_store._objects[aid]["meta"] == {"v": 1}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# download_file presign / inline fallback
+# ─────────────────────────────────────────────────────────────────────────────
+@pytest.mark.asyncio
+async def test_download_large_raises_when_presign_fails(fake_store, no_presign):
+    aid = await _store_blob(fake_store, tools._INLINE_LIMIT + 1)
+    with pytest.raises(ValueError, match="presign unavailable"):
+        await tools.download_file(aid, presign=True)
+
+
+@pytest.mark.asyncio
+async def test_download_small_falls_back_inline_when_presign_fails(fake_store, no_presign):
+    aid = await _store_blob(fake_store, 10)
+    result = await tools.download_file(aid, presign=True)
+    assert result["download_url"] is None
+    assert base64.b64decode(result["data_base64"]) == b"x" * 10
+
+
+@pytest.mark.asyncio
+async def test_download_without_presign_is_always_inline(fake_store):
+    size = tools._INLINE_LIMIT + 1
+    aid = await _store_blob(fake_store, size)
+    result = await tools.download_file(aid, presign=False)
+    assert result["artifact"]["artifact_id"] == aid
+    assert result["download_url"] is None
+    assert len(base64.b64decode(result["data_base64"])) == size